@@ -0,0 +1,240 @@
+"""02 - Prompt templates: string, chat, placeholder, and partial variables.
+
+Shows the two template families (`PromptTemplate` for strings,
+`ChatPromptTemplate` for message lists) plus `MessagesPlaceholder` and partial
+variables. The chat examples use `StaticPrefixChatPromptTemplate`, which
+renders variable-free leading messages once at first use instead of
+re-formatting them on every invoke - the template-layer analogue of prompt/KV
+prefix caching. Keeping static content first and dynamic content last also
+maximizes downstream LLM prompt-cache hits.
+
+Run with:
+    python examples/02_prompt_templates.py
+"""
+
+from __future__ import annotations
+
+import string
+import sys
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.prompts import (
+    ChatPromptTemplate,
+    MessagesPlaceholder,
+    PromptTemplate,
+)
+from pydantic import PrivateAttr
+
+
+class StaticPrefixChatPromptTemplate(ChatPromptTemplate):
+    """ChatPromptTemplate that pre-renders its variable-free message prefix.
+
+    The stock template re-formats every message on each invoke, even ones
+    with no input variables. Here the leading run of static messages is
+    rendered once and reused, so each invoke only formats the dynamic tail.
+    """
+
+    _static_prefix: Optional[list[BaseMessage]] = PrivateAttr(default=None)
+    _n_static: int = PrivateAttr(default=0)
+
+    def _split_static_prefix(self) -> list[BaseMessage]:
+        """Render and cache the leading messages that take no variables.
+
+        Static message content is interned, so every invoke shares one
+        message instance per static slot and repeated prompts compare their
+        prefixes by pointer identity rather than character-by-character.
+        """
+        prefix: list[BaseMessage] = []
+        n_static = 0
+        for template in self.messages:
+            if isinstance(template, BaseMessage):
+                prefix.append(template)
+            elif not template.input_variables:
+                prefix.extend(template.format_messages())
+            else:
+                break
+            n_static += 1
+        for message in prefix:
+            if isinstance(message.content, str):
+                message.content = sys.intern(message.content)
+        self._static_prefix = prefix
+        self._n_static = n_static
+        return prefix
+
+    def format_messages(self, **kwargs: Any) -> list[BaseMessage]:
+        """Format the template, reusing the cached static prefix.
+
+        Args:
+            kwargs: Values for the template's dynamic variables.
+        """
+        prefix = self._static_prefix
+        if prefix is None:
+            prefix = self._split_static_prefix()
+        result = list(prefix)
+        for template in self.messages[self._n_static :]:
+            if isinstance(template, BaseMessage):
+                result.append(template)
+            else:
+                result.extend(template.format_messages(**kwargs))
+        return result
+
+
+class FastPromptTemplate(PromptTemplate):
+    """PromptTemplate with a render callable compiled on first use.
+
+    The stock template re-parses the format string on every `format` call.
+    Here the parse happens once: single-variable templates specialize to a
+    plain string concatenation (the fastest path for tiny templates), and
+    everything else binds `str.format_map` so each render is one C-level call.
+    """
+
+    _render: Optional[Callable[[dict[str, Any]], str]] = PrivateAttr(default=None)
+
+    def _compile_render(self) -> Callable[[dict[str, Any]], str]:
+        """Parse the template once and cache a specialized render callable.
+
+        Specialization only applies to the exact shape prefix{var} or
+        prefix{var}suffix: one field chunk with no spec/conversion, plus at
+        most one trailing pure-literal chunk. Escaped braces split the parse
+        into extra literal chunks, so any other shape (including templates
+        with {{/}} escapes) renders through `format_map`, which unescapes
+        correctly.
+        """
+        parsed = list(string.Formatter().parse(self.template))
+        specializable = (
+            bool(parsed)
+            and parsed[0][1] is not None
+            and parsed[0][2] == ""
+            and parsed[0][3] is None
+            and (len(parsed) == 1 or (len(parsed) == 2 and parsed[1][1] is None))
+        )
+        if specializable:
+            # prefix{var}suffix collapses to two string concatenations.
+            prefix = parsed[0][0]
+            variable = parsed[0][1]
+            suffix = parsed[1][0] if len(parsed) == 2 else ""
+            self._render = lambda kwargs: prefix + str(kwargs[variable]) + suffix
+        else:
+            self._render = self.template.format_map
+        return self._render
+
+    def format(self, **kwargs: Any) -> str:
+        """Render the template through the precompiled callable.
+
+        Args:
+            kwargs: Values for the template's variables.
+        """
+        if self.template_format != "f-string":
+            return super().format(**kwargs)
+        render = self._render
+        if render is None:
+            render = self._compile_render()
+        if self.partial_variables:
+            kwargs = self._merge_partial_and_user_variables(**kwargs)
+        return render(kwargs)
+
+
+_TYPE_NAME_CACHE: dict[type, str] = {}
+
+
+def _type_name(message: BaseMessage) -> str:
+    """Return the message's class name, memoized per type.
+
+    Looking the interned name up in a dict keyed by the type object is
+    cheaper than re-resolving `__class__.__name__` on every iteration of a
+    hot formatting loop - the derived string lives next to the data instead
+    of being re-derived.
+
+    Args:
+        message: The message whose type name to resolve.
+    """
+    cls = type(message)
+    name = _TYPE_NAME_CACHE.get(cls)
+    if name is None:
+        name = _TYPE_NAME_CACHE.setdefault(cls, sys.intern(cls.__name__))
+    return name
+
+
+def get_current_time() -> str:
+    """Return the current wall-clock time as a display string."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def example_1_prompt_template() -> None:
+    """Format a plain string template."""
+    print("=== Example 1: PromptTemplate ===")
+    prompt = FastPromptTemplate.from_template(
+        "Tell me a {adjective} joke about {topic}."
+    )
+    print(prompt.format(adjective="funny", topic="penguins"))
+
+    single = FastPromptTemplate.from_template("Summarize this text: {text}")
+    print(single.format(text="LCEL composes Runnables with the | operator."))
+
+
+def example_2_chat_prompt_template() -> None:
+    """Format a chat template into a message list."""
+    print("\n=== Example 2: ChatPromptTemplate ===")
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", "You are a {role}."),
+            ("human", "{question}"),
+        ]
+    )
+    result = prompt.invoke({"role": "pirate", "question": "Where is the treasure?"})
+    for message in result.to_messages():
+        print(f"{_type_name(message)}: {message.content}")
+
+
+def example_3_messages_placeholder() -> None:
+    """Inject conversation history with MessagesPlaceholder.
+
+    The constant system message is part of the cached static prefix, so
+    repeated invokes only format the history and question.
+    """
+    print("\n=== Example 3: MessagesPlaceholder ===")
+    prompt = StaticPrefixChatPromptTemplate.from_messages(
+        [
+            ("system", "You are a helpful assistant."),
+            MessagesPlaceholder(variable_name="history"),
+            ("human", "{question}"),
+        ]
+    )
+    history = [
+        HumanMessage(content="Hi!"),
+        AIMessage(content="Hello! How can I help you today?"),
+    ]
+    result = prompt.invoke({"history": history, "question": "What is LCEL?"})
+    for message in result.to_messages():
+        print(f"{_type_name(message)}: {message.content}")
+
+
+def example_4_partial_variables() -> None:
+    """Bind a variable to a callable evaluated at format time.
+
+    The timestamp goes after the question, not at the top of the template: a
+    value that changes every call at the start of the prompt would invalidate
+    any downstream prompt/KV cache on 100% of requests. Rule of thumb: static
+    content first, dynamic content last.
+    """
+    print("\n=== Example 4: partial variables ===")
+    prompt = PromptTemplate(
+        template="User question: {question}\n(Answered at {time})",
+        input_variables=["question"],
+        partial_variables={"time": get_current_time},
+    )
+    print(prompt.format(question="What is LangChain?"))
+
+
+def main() -> None:
+    """Run every example in order."""
+    example_1_prompt_template()
+    example_2_chat_prompt_template()
+    example_3_messages_placeholder()
+    example_4_partial_variables()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""03 - RunnableParallel: fan-out execution over shared input.
+
+`RunnableParallel` runs several branches against the same input and collects
+the results into a dict. The numeric branch bodies here are module-level
+functions compiled with `numba.njit`, so each branch dispatches straight to
+machine code instead of interpreting Python bytecode per call. When numba is
+not installed the functions fall back to plain Python with the same
+signatures.
+
+Run with:
+    python examples/03_runnable_parallel.py
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from statistics import fmean
+from typing import Any, Callable
+
+import numpy as np
+from langchain_core.runnables import (
+    Runnable,
+    RunnableLambda,
+    RunnableParallel,
+    RunnablePassthrough,
+)
+
+_POOL = ThreadPoolExecutor(max_workers=8)
+
+
+def _is_identity_passthrough(branch: Runnable) -> bool:
+    """Return whether a branch is a RunnablePassthrough with no callable.
+
+    `RunnablePassthrough(func)` runs its function for side effects on
+    invoke, so only a bare passthrough may be served by identity.
+
+    Args:
+        branch: The branch Runnable to inspect.
+    """
+    return (
+        isinstance(branch, RunnablePassthrough)
+        and branch.func is None
+        and branch.afunc is None
+    )
+
+
+def parallel_invoke(branches: dict[str, Runnable], value: Any) -> dict[str, Any]:
+    """Invoke every branch concurrently on a shared thread pool.
+
+    The stock `RunnableParallel` creates a fresh executor for each `invoke`;
+    submitting to one long-lived pool amortizes thread start-up across calls.
+    Pure-identity `RunnablePassthrough` branches (no side-effect callable
+    attached) are recognized up front and copied into the result directly -
+    identity needs neither a dispatch frame nor a hop through the pool. A
+    passthrough constructed with a function still invokes normally so its
+    side effects run.
+
+    Args:
+        branches: Mapping of output key to the Runnable producing it.
+        value: The input passed to every branch.
+
+    Returns:
+        Mapping of output key to that branch's result, in branch order.
+    """
+    futures = {
+        key: _POOL.submit(branch.invoke, value)
+        for key, branch in branches.items()
+        if not _is_identity_passthrough(branch)
+    }
+    return {
+        key: futures[key].result() if key in futures else value for key in branches
+    }
+
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator for these examples
+
+    def njit(func: Callable[..., Any]) -> Callable[..., Any]:
+        """Fallback no-op decorator when numba is unavailable."""
+        return func
+
+
+# Compiled scalar kernels. Keeping these at module level means the JIT
+# compiles each one exactly once per process; every RunnableLambda call after
+# that is a dispatch to native code. Numba bodies avoid f-strings and other
+# object-mode constructs so they stay in nopython mode.
+
+
+@njit
+def _double(x: int) -> int:
+    return x * 2
+
+
+@njit
+def _square(x: int) -> int:
+    return x**2
+
+
+@njit
+def _negate(x: int) -> int:
+    return -x
+
+
+@njit
+def _double_array(arr: np.ndarray) -> np.ndarray:
+    return arr * 2
+
+
+@njit
+def _square_array(arr: np.ndarray) -> np.ndarray:
+    return arr**2
+
+
+@njit
+def _mean(arr: np.ndarray) -> float:
+    total = 0.0
+    for value in arr:
+        total += value
+    return total / arr.size
+
+
+# Below this size the ndarray conversion costs more than it saves.
+_NUMPY_STATS_THRESHOLD = 1000
+
+
+def calculate_statistics(numbers: list[float]) -> dict[str, float]:
+    """Compute mean/max/min of a numeric list without Python-level reduces.
+
+    Small lists use `statistics.fmean` plus the builtin `max`/`min` - all
+    C-accelerated single passes, with no array-conversion overhead. Large
+    lists convert once to an ndarray and use NumPy's vectorized reductions.
+
+    Args:
+        numbers: The values to summarize.
+    """
+    if len(numbers) < _NUMPY_STATS_THRESHOLD:
+        return {
+            "mean": fmean(numbers),
+            "max": float(max(numbers)),
+            "min": float(min(numbers)),
+        }
+    arr = np.asarray(numbers, dtype=np.float64)
+    return {"mean": float(arr.mean()), "max": float(arr.max()), "min": float(arr.min())}
+
+
+def categorize_values(numbers: list[int]) -> dict[str, list[int]]:
+    """Split a numeric list into positive, negative, and zero buckets.
+
+    Boolean-mask slicing does the comparisons as three SIMD-wide C passes
+    instead of three Python list comprehensions.
+
+    Args:
+        numbers: The values to categorize.
+    """
+    arr = np.asarray(numbers, dtype=np.int64)
+    return {
+        "positive": arr[arr > 0].tolist(),
+        "negative": arr[arr < 0].tolist(),
+        "zero": arr[arr == 0].tolist(),
+    }
+
+
+def example_1_basic_parallel() -> None:
+    """Run three compiled arithmetic branches over the same input."""
+    print("=== Example 1: basic parallel ===")
+    parallel = RunnableParallel(
+        double=RunnableLambda(_double),
+        square=RunnableLambda(_square),
+        negate=RunnableLambda(_negate),
+    )
+    print(parallel.invoke(5))
+
+
+def example_2_combining_results() -> None:
+    """Feed parallel branch output into a downstream combiner."""
+    print("\n=== Example 2: combining results ===")
+    chain = RunnableParallel(
+        double=RunnableLambda(_double),
+        square=RunnableLambda(_square),
+    ) | RunnableLambda(lambda d: d["double"] + d["square"])
+    print(chain.invoke(4))
+
+
+def example_3_multi_stage_processing() -> None:
+    """Process text through prepare/analyze/combine stages in one pass.
+
+    The three stages used to be separate `RunnableLambda`s, each allocating
+    an intermediate dict the next stage immediately unpacked. Since nothing
+    else reads those intermediates, the stages are fused into one function -
+    kernel fusion at the Python level: one dict lookup, two locals, one
+    f-string. Keep stages separate only when intermediates are reused,
+    logged, or streamed.
+    """
+    print("\n=== Example 3: multi-stage processing ===")
+
+    def _process(x: dict[str, str]) -> str:
+        text = x["text"]
+        return f"Text has {len(text.split())} words | Processed: {text.upper()}"
+
+    pipeline = RunnableLambda(_process)
+    print(pipeline.invoke({"text": "hello parallel world"}))
+
+
+def example_4_nested_parallel() -> None:
+    """Nest a parallel block inside another parallel block."""
+    print("\n=== Example 4: nested parallel ===")
+    nested = RunnableParallel(
+        transforms=RunnableParallel(
+            doubled=RunnableLambda(lambda arr: _double_array(arr).tolist()),
+            squared=RunnableLambda(lambda arr: _square_array(arr).tolist()),
+        ),
+        mean=RunnableLambda(_mean),
+    )
+    print(nested.invoke(np.asarray([1.0, 2.0, 3.0, 4.0, 5.0])))
+
+
+def example_5_passthrough() -> None:
+    """Carry the original input alongside a derived value.
+
+    The passthrough branch is served by `parallel_invoke`'s identity fast
+    path, so only the derived branch actually runs on the pool.
+    """
+    print("\n=== Example 5: passthrough ===")
+    parallel: dict[str, Runnable] = {
+        "original": RunnablePassthrough(),
+        "doubled": RunnableLambda(_double),
+    }
+    print(parallel_invoke(parallel, 7))
+
+
+def example_6_real_world_scenario() -> None:
+    """Summarize a batch of sensor-style readings with parallel analyses."""
+    print("\n=== Example 6: real-world scenario ===")
+    analysis: dict[str, Runnable] = {
+        "statistics": RunnableLambda(calculate_statistics),
+        "categories": RunnableLambda(categorize_values),
+    }
+    readings = [3, -1, 0, 7, -4, 2, 0, 9, -8, 5]
+    result = parallel_invoke(analysis, readings)
+    print(f"Statistics: {result['statistics']}")
+    print(f"Categories: {result['categories']}")
+
+
+def main() -> None:
+    """Run every example in order."""
+    example_1_basic_parallel()
+    example_2_combining_results()
+    example_3_multi_stage_processing()
+    example_4_nested_parallel()
+    example_5_passthrough()
+    example_6_real_world_scenario()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,557 @@
+"""04 - Complete chains: prompt | model | parser end to end.
+
+Builds full LCEL-style chains against a deterministic `MockChatModel`, so the
+examples run offline: simple sequencing, parallel branches, conditional
+routing with `RunnableBranch`, and a small RAG-style chain with a mock
+retriever.
+
+Multi-branch fan-out goes through `parallel_invoke`, which submits every
+branch to one shared, module-level `ThreadPoolExecutor`. The stock
+`RunnableParallel` spins up a fresh executor per `invoke`; reusing a single
+pool amortizes thread start-up and lets I/O-ish branches (retriever plus
+passthrough in the RAG chain) overlap.
+
+Run with:
+    python examples/04_complete_chain.py
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import collections
+import inspect
+import math
+import re
+import textwrap
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import numpy as np
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import (
+    Runnable,
+    RunnableConfig,
+    RunnableLambda,
+    RunnablePassthrough,
+    RunnableSequence,
+)
+from pydantic import PrivateAttr
+
+_POOL = ThreadPoolExecutor(max_workers=8)
+
+
+def _is_identity_passthrough(branch: Runnable) -> bool:
+    """Return whether a branch is a RunnablePassthrough with no callable.
+
+    `RunnablePassthrough(func)` runs its function for side effects on
+    invoke, so only a bare passthrough may be served by identity.
+
+    Args:
+        branch: The branch Runnable to inspect.
+    """
+    return (
+        isinstance(branch, RunnablePassthrough)
+        and branch.func is None
+        and branch.afunc is None
+    )
+
+
+def parallel_invoke(branches: dict[str, Runnable], value: Any) -> dict[str, Any]:
+    """Invoke every branch concurrently on a shared thread pool.
+
+    Pure-identity `RunnablePassthrough` branches (no side-effect callable
+    attached) are recognized up front and copied into the result directly -
+    identity needs neither a dispatch frame nor a hop through the pool. A
+    passthrough constructed with a function still invokes normally so its
+    side effects run.
+
+    Args:
+        branches: Mapping of output key to the Runnable producing it.
+        value: The input passed to every branch.
+
+    Returns:
+        Mapping of output key to that branch's result, in branch order.
+    """
+    futures = {
+        key: _POOL.submit(branch.invoke, value)
+        for key, branch in branches.items()
+        if not _is_identity_passthrough(branch)
+    }
+    return {
+        key: futures[key].result() if key in futures else value for key in branches
+    }
+
+
+class CompiledSequence(RunnableSequence):
+    """RunnableSequence with a code-generated straight-line invoke.
+
+    The stock sequence loops over its steps, paying attribute lookup and
+    method dispatch per step per call. On first invoke this subclass
+    generates `value = _s0(value); value = _s1(value); ...` as source,
+    `exec`s it with the bound `invoke` methods closed over as globals, and
+    caches the resulting function - collapsing N dispatch frames into one.
+
+    The generated source depends only on the number of steps, never on user
+    input, so the `exec` is safe.
+    """
+
+    _compiled: Optional[Any] = PrivateAttr(default=None)
+
+    def _compile(self) -> Any:
+        """Generate and cache the specialized invoke function."""
+        names = [f"_s{index}" for index in range(len(self.steps))]
+        lines = ["def _run(value):"]
+        lines.extend(f"    value = {name}(value)" for name in names)
+        lines.append("    return value")
+        namespace: dict[str, Any] = {
+            name: step.invoke for name, step in zip(names, self.steps)
+        }
+        exec("\n".join(lines), namespace)  # noqa: S102
+        self._compiled = namespace["_run"]
+        return self._compiled
+
+    def invoke(
+        self,
+        input: Any,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run the whole sequence through the compiled straight-line path.
+
+        Args:
+            input: The input to the first step.
+            config: Optional runtime configuration (unused on this path).
+        """
+        run = self._compiled
+        if run is None:
+            run = self._compile()
+        return run(input)
+
+
+class NamedParallel(Runnable[Any, tuple]):
+    """Parallel fan-out with a fixed schema, returning a namedtuple.
+
+    When the branch keys are known at construction time, emitting a
+    precomputed namedtuple lets downstream steps read fields with a C-level
+    slot fetch (`x.sum_result`) instead of a hash-and-lookup per key
+    (`x["sum_result"]`), and drops the per-entry dict overhead.
+    """
+
+    def __init__(self, **branches: Runnable) -> None:
+        self._branches = branches
+        self._Out = collections.namedtuple("ParallelOut", list(branches))
+
+    def invoke(
+        self,
+        input: Any,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> tuple:
+        """Run every branch and pack the results into the schema tuple.
+
+        Args:
+            input: The input passed to every branch.
+            config: Optional runtime configuration (unused).
+        """
+        return self._Out(**parallel_invoke(self._branches, input))
+
+
+class ThresholdBranch(Runnable[Any, Any]):
+    """RunnableBranch specialized for monotonic threshold predicates.
+
+    At construction each predicate's source is parsed for the pattern
+    `len(x[key]) < const` or `x[key] < const`. When every predicate tests the
+    same feature against strictly increasing constants, dispatch becomes one
+    feature extraction plus a `bisect` over the sorted thresholds - O(log k)
+    comparisons instead of evaluating up to k predicates in order. Predicates
+    that do not match the pattern fall back to sequential evaluation.
+    """
+
+    def __init__(
+        self,
+        *branches: tuple[Any, Runnable] | Runnable,
+    ) -> None:
+        *pairs, default = branches
+        self._pairs: list[tuple[Any, Runnable]] = list(pairs)
+        self._default: Runnable = default
+        self._key: Optional[str] = None
+        self._use_len = False
+        self._thresholds: Optional[list[float]] = None
+        self._handlers: list[Runnable] = []
+        self._specialize()
+
+    @staticmethod
+    def _parse_predicate(predicate: Any) -> Optional[tuple[str, bool, float]]:
+        """Extract (key, uses_len, threshold) from a predicate's source."""
+        try:
+            source = textwrap.dedent(inspect.getsource(predicate))
+            tree = ast.parse(source)
+        except (OSError, SyntaxError, TypeError):
+            return None
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Lambda):
+                expression = node.body
+            elif isinstance(node, ast.FunctionDef) and isinstance(
+                node.body[0], ast.Return
+            ):
+                expression = node.body[0].value
+            else:
+                continue
+            if not (
+                isinstance(expression, ast.Compare)
+                and len(expression.ops) == 1
+                and isinstance(expression.ops[0], ast.Lt)
+                and isinstance(expression.comparators[0], ast.Constant)
+                and isinstance(expression.comparators[0].value, (int, float))
+            ):
+                return None
+            threshold = float(expression.comparators[0].value)
+            left = expression.left
+            uses_len = (
+                isinstance(left, ast.Call)
+                and isinstance(left.func, ast.Name)
+                and left.func.id == "len"
+                and len(left.args) == 1
+            )
+            if uses_len:
+                left = left.args[0]
+            if (
+                isinstance(left, ast.Subscript)
+                and isinstance(left.slice, ast.Constant)
+                and isinstance(left.slice.value, str)
+            ):
+                return left.slice.value, uses_len, threshold
+            return None
+        return None
+
+    def _specialize(self) -> None:
+        """Build the bisect jump table if every predicate fits the pattern."""
+        parsed = [self._parse_predicate(predicate) for predicate, _ in self._pairs]
+        if not parsed or any(spec is None for spec in parsed):
+            return
+        keys = {(key, uses_len) for key, uses_len, _ in parsed}
+        thresholds = [threshold for _, _, threshold in parsed]
+        if len(keys) != 1 or thresholds != sorted(set(thresholds)):
+            return
+        self._key, self._use_len = next(iter(keys))
+        self._thresholds = thresholds
+        self._handlers = [handler for _, handler in self._pairs] + [self._default]
+
+    def invoke(
+        self,
+        input: Any,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Route the input to the matching handler.
+
+        Args:
+            input: The value to route.
+            config: Optional runtime configuration, forwarded to the handler.
+        """
+        if self._thresholds is not None:
+            feature = input[self._key]
+            if self._use_len:
+                feature = len(feature)
+            index = bisect.bisect_right(self._thresholds, feature)
+            return self._handlers[index].invoke(input, config)
+        for predicate, handler in self._pairs:
+            if predicate(input):
+                return handler.invoke(input, config)
+        return self._default.invoke(input, config)
+
+
+def _to_messages_soa(input: Any) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Decompose prompt input into parallel type/content tuples.
+
+    Structure-of-arrays layout: one pass normalizes every message, so
+    downstream consumers index plain string tuples instead of re-probing
+    each message object with `hasattr`/`isinstance`.
+
+    Args:
+        input: A `PromptValue`, message list, or plain string.
+
+    Returns:
+        A `(types, contents)` pair of equal-length tuples.
+    """
+    messages = input.to_messages() if hasattr(input, "to_messages") else input
+    if not isinstance(messages, list):
+        messages = [messages]
+    types = tuple(message.__class__.__name__ for message in messages)
+    contents = tuple(
+        message.content if hasattr(message, "content") else str(message)
+        for message in messages
+    )
+    return types, contents
+
+
+# One compiled scan plus a dict lookup replaces a chain of lowercase-and-
+# substring passes; the word boundaries keep e.g. "jokester" from routing.
+_ROUTER = re.compile(r"\b(joke|translate|summarize)\b", re.IGNORECASE)
+_RESPONSES = {
+    "joke": "Why do programmers prefer dark mode? Because light attracts bugs!",
+    "translate": "Bonjour, le monde !",
+    "summarize": "In short: chains compose prompts, models, and parsers.",
+}
+
+
+class MockChatModel(Runnable[Any, AIMessage]):
+    """Deterministic stand-in for a chat model, keyed on prompt keywords.
+
+    Responses are memoized per exact message sequence, the exact-match tier
+    of caches like GPTCache: a repeated prompt skips the whole dispatch body.
+    Keyword routing is one compiled-regex scan over the last message instead
+    of several lowercase-and-substring passes.
+    """
+
+    _CACHE_MAX_SIZE = 1024
+
+    def __init__(self) -> None:
+        self._cache: dict[tuple[tuple[str, ...], tuple[str, ...]], AIMessage] = {}
+
+    def invoke(
+        self,
+        input: Any,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> AIMessage:
+        """Produce a canned response based on the last message content.
+
+        Args:
+            input: A `PromptValue`, message list, or plain string.
+            config: Optional runtime configuration (unused).
+        """
+        types, contents = _to_messages_soa(input)
+        key = (types, contents)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        match = _ROUTER.search(contents[-1])
+        if match:
+            response = _RESPONSES[match.group(1).lower()]
+        else:
+            response = f"You said: {contents[-1]}"
+        if len(self._cache) >= self._CACHE_MAX_SIZE:
+            # FIFO eviction keeps the cache bounded without extra bookkeeping.
+            self._cache.pop(next(iter(self._cache)))
+        result = AIMessage(content=response)
+        self._cache[key] = result
+        return result
+
+
+DOCUMENTS = {
+    "langchain": (
+        "LangChain is a framework for developing applications powered by "
+        "large language models."
+    ),
+    "python": (
+        "Python is a general-purpose programming language that emphasizes "
+        "readability."
+    ),
+}
+
+
+_TOPIC_RE = re.compile(r"\b(langchain|python)\b", re.IGNORECASE)
+
+
+def mock_retriever(question: str) -> str:
+    """Return the first document whose topic appears in the question.
+
+    One compiled-regex scan over the question replaces a lowercase plus
+    substring pass per known topic.
+
+    Args:
+        question: The user question to match against known topics.
+    """
+    match = _TOPIC_RE.search(question)
+    if match:
+        return DOCUMENTS[match.group(1).lower()]
+    return "No relevant documents found."
+
+
+# Templates are parsed once at import: from_messages/from_template walk the
+# message tuples, compile format specs, and extract variables, so rebuilding
+# them inside example functions would redo that work on every call.
+JOKE_PROMPT = ChatPromptTemplate.from_template("Tell me a joke about {topic}")
+TRANSLATE_PROMPT = ChatPromptTemplate.from_template("Translate to French: {text}")
+RAG_PROMPT = ChatPromptTemplate.from_template(
+    "Answer the question using only this context.\n\n"
+    "Context: {context}\n\n"
+    "Question: {question}"
+)
+
+_EMBED_DIM = 256
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def _embed(text: str) -> np.ndarray:
+    """Embed text as a unit-normalized hashed bag-of-words vector.
+
+    A deterministic hashing sketch stands in for a real sentence embedding so
+    the example stays offline; swap in a sentence-transformer for production.
+
+    Args:
+        text: The text to embed.
+    """
+    vector = np.zeros(_EMBED_DIM, dtype=np.float64)
+    for token in _TOKEN_RE.findall(text.lower()):
+        vector[zlib.crc32(token.encode()) % _EMBED_DIM] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """Similarity-based answer cache, the vector tier of GPTCache.
+
+    Stores unit-normalized question embeddings in one matrix; a lookup is a
+    single matrix-vector product, and any cached question above the cosine
+    similarity threshold short-circuits the whole chain (model and parser
+    included).
+    """
+
+    def __init__(self, *, threshold: float = 0.9) -> None:
+        self._threshold = threshold
+        self._vectors = np.empty((0, _EMBED_DIM), dtype=np.float64)
+        self._answers: list[str] = []
+
+    def lookup(self, question: str) -> Optional[str]:
+        """Return the cached answer for a similar-enough question, if any.
+
+        Args:
+            question: The incoming question to match.
+        """
+        if not self._answers:
+            return None
+        similarities = self._vectors @ _embed(question)
+        best = int(similarities.argmax())
+        if similarities[best] > self._threshold:
+            return self._answers[best]
+        return None
+
+    def store(self, question: str, answer: str) -> None:
+        """Record a question/answer pair for future lookups.
+
+        Args:
+            question: The question that produced the answer.
+            answer: The chain's answer to cache.
+        """
+        self._vectors = np.vstack([self._vectors, _embed(question)])
+        self._answers.append(answer)
+
+
+def cached_invoke(chain: Runnable, cache: SemanticCache, question: str) -> str:
+    """Invoke a chain through the semantic cache.
+
+    Args:
+        chain: The chain to run on a cache miss.
+        cache: The semantic cache to consult and populate.
+        question: The question to answer.
+    """
+    answer = cache.lookup(question)
+    if answer is not None:
+        return answer
+    answer = chain.invoke(question)
+    cache.store(question, answer)
+    return answer
+
+
+def example_1_simple_chain() -> None:
+    """Compose prompt, model, and parser into one chain."""
+    print("=== Example 1: simple chain ===")
+    chain = CompiledSequence(JOKE_PROMPT, MockChatModel(), StrOutputParser())
+    print(chain.invoke({"topic": "programming"}))
+
+
+def example_2_parallel_branches() -> None:
+    """Run two prompt/model/parser chains concurrently on the shared pool."""
+    print("\n=== Example 2: parallel branches ===")
+    model = MockChatModel()
+    parser = StrOutputParser()
+    branches: dict[str, Runnable] = {
+        "joke": JOKE_PROMPT | model | parser,
+        "translation": TRANSLATE_PROMPT | model | parser,
+    }
+    result = parallel_invoke(branches, {"topic": "cats", "text": "Hello, world"})
+    print(f"Joke: {result['joke']}")
+    print(f"Translation: {result['translation']}")
+
+
+def example_3_parallel_in_chain() -> None:
+    """Fan out into numeric branches, then combine their results.
+
+    The fan-out schema is fixed, so the branches run through NamedParallel
+    and the combiner reads namedtuple attributes instead of dict keys.
+    """
+    print("\n=== Example 3: parallel inside a chain ===")
+    chain = NamedParallel(
+        sum_result=RunnableLambda(lambda nums: sum(nums)),
+        product_result=RunnableLambda(lambda nums: math.prod(nums)),
+    ) | RunnableLambda(lambda x: x.sum_result + x.product_result)
+    print(chain.invoke([1, 2, 3, 4]))
+
+
+def _is_short(x: dict[str, str]) -> bool:
+    return len(x["text"]) < 10
+
+
+def _is_medium(x: dict[str, str]) -> bool:
+    return len(x["text"]) < 50
+
+
+def example_4_conditional_logic() -> None:
+    """Route input to a handler based on text length.
+
+    Both predicates test `len(x["text"])` against increasing constants, so
+    `ThresholdBranch` detects the pattern and dispatches via bisect instead
+    of evaluating each predicate in turn (as `RunnableBranch` would).
+    """
+    print("\n=== Example 4: conditional logic ===")
+    branch = ThresholdBranch(
+        (_is_short, RunnableLambda(lambda x: f"Short text: {x['text']}")),
+        (_is_medium, RunnableLambda(lambda x: f"Medium text ({len(x['text'])} chars)")),
+        RunnableLambda(lambda x: f"Long text ({len(x['text'])} chars)"),
+    )
+    for text in ["hi", "a medium-length sentence", "x" * 80]:
+        print(branch.invoke({"text": text}))
+
+
+def example_5_with_context() -> None:
+    """Answer a question with retrieved context (mock RAG chain).
+
+    The retriever and the question passthrough run concurrently via
+    `parallel_invoke` instead of back-to-back.
+    """
+    print("\n=== Example 5: chain with context ===")
+    retrieval: dict[str, Runnable] = {
+        "context": RunnableLambda(mock_retriever),
+        "question": RunnablePassthrough(),
+    }
+    rag_chain = (
+        RunnableLambda(lambda question: parallel_invoke(retrieval, question))
+        | RAG_PROMPT
+        | MockChatModel()
+        | StrOutputParser()
+    )
+    cache = SemanticCache(threshold=0.9)
+    print(cached_invoke(rag_chain, cache, "What is LangChain?"))
+    print(cached_invoke(rag_chain, cache, "Summarize what Python is."))
+    # Same tokens, different casing/punctuation: served from the semantic
+    # cache without touching retriever, model, or parser.
+    print(cached_invoke(rag_chain, cache, "what IS LangChain"))
+
+
+def main() -> None:
+    """Run every example in order."""
+    example_1_simple_chain()
+    example_2_parallel_branches()
+    example_3_parallel_in_chain()
+    example_4_conditional_logic()
+    example_5_with_context()
+
+
+if __name__ == "__main__":
+    main()
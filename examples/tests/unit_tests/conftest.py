@@ -0,0 +1,50 @@
+"""Shared fixtures for the example-script unit tests.
+
+The example scripts are numbered files, not an importable package, so they
+are loaded by path and cached in `sys.modules` under importable aliases.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+_EXAMPLES_DIR = Path(__file__).resolve().parents[2]
+
+
+def _load_example(stem: str) -> ModuleType:
+    """Load an example script by file stem, reusing any cached module.
+
+    Args:
+        stem: The example's filename without the .py suffix.
+    """
+    name = f"example_{stem}"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, _EXAMPLES_DIR / f"{stem}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def prompt_templates() -> ModuleType:
+    """The 02_prompt_templates example module."""
+    return _load_example("02_prompt_templates")
+
+
+@pytest.fixture(scope="session")
+def runnable_parallel() -> ModuleType:
+    """The 03_runnable_parallel example module."""
+    return _load_example("03_runnable_parallel")
+
+
+@pytest.fixture(scope="session")
+def complete_chain() -> ModuleType:
+    """The 04_complete_chain example module."""
+    return _load_example("04_complete_chain")
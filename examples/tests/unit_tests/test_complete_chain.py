@@ -0,0 +1,131 @@
+"""Unit tests for ThresholdBranch and SemanticCache in 04_complete_chain."""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+from langchain_core.runnables import RunnableLambda
+
+
+def _below_ten(x: dict[str, int]) -> bool:
+    return x["n"] < 10
+
+
+def _below_fifty(x: dict[str, int]) -> bool:
+    return x["n"] < 50
+
+
+def _short_text(x: dict[str, str]) -> bool:
+    return len(x["text"]) < 10
+
+
+def _other_key(x: dict[str, int]) -> bool:
+    return x["m"] < 50
+
+
+def _is_even(x: dict[str, int]) -> bool:
+    return x["n"] % 2 == 0
+
+
+def test_threshold_branch_specializes_subscript_predicates(
+    complete_chain: ModuleType,
+) -> None:
+    """Predicates of the form x[key] < const build the jump table."""
+    branch = complete_chain.ThresholdBranch(
+        (_below_ten, RunnableLambda(lambda x: "small")),
+        (_below_fifty, RunnableLambda(lambda x: "medium")),
+        RunnableLambda(lambda x: "large"),
+    )
+
+    assert branch._thresholds == [10.0, 50.0]
+    assert branch.invoke({"n": 9}) == "small"
+    assert branch.invoke({"n": 10}) == "medium"
+    assert branch.invoke({"n": 49}) == "medium"
+    assert branch.invoke({"n": 50}) == "large"
+
+
+def test_threshold_branch_specializes_len_predicates(
+    complete_chain: ModuleType,
+) -> None:
+    """Predicates of the form len(x[key]) < const also specialize."""
+    branch = complete_chain.ThresholdBranch(
+        (_short_text, RunnableLambda(lambda x: "short")),
+        RunnableLambda(lambda x: "long"),
+    )
+
+    assert branch._thresholds == [10.0]
+    assert branch.invoke({"text": "hi"}) == "short"
+    assert branch.invoke({"text": "x" * 10}) == "long"
+
+
+def test_threshold_branch_falls_back_on_mixed_keys(
+    complete_chain: ModuleType,
+) -> None:
+    """Predicates over different keys cannot share a jump table."""
+    branch = complete_chain.ThresholdBranch(
+        (_below_ten, RunnableLambda(lambda x: "small")),
+        (_other_key, RunnableLambda(lambda x: "other")),
+        RunnableLambda(lambda x: "default"),
+    )
+
+    assert branch._thresholds is None
+    assert branch.invoke({"n": 5, "m": 100}) == "small"
+    assert branch.invoke({"n": 100, "m": 5}) == "other"
+    assert branch.invoke({"n": 100, "m": 100}) == "default"
+
+
+def test_threshold_branch_falls_back_on_non_threshold_predicate(
+    complete_chain: ModuleType,
+) -> None:
+    """Predicates outside the < const pattern run sequentially."""
+    branch = complete_chain.ThresholdBranch(
+        (_is_even, RunnableLambda(lambda x: "even")),
+        RunnableLambda(lambda x: "odd"),
+    )
+
+    assert branch._thresholds is None
+    assert branch.invoke({"n": 4}) == "even"
+    assert branch.invoke({"n": 3}) == "odd"
+
+
+def test_semantic_cache_hit_on_equivalent_question(
+    complete_chain: ModuleType,
+) -> None:
+    """Same tokens with different casing/punctuation hit the cache."""
+    cache = complete_chain.SemanticCache(threshold=0.9)
+    cache.store("What is LangChain?", "the answer")
+
+    assert cache.lookup("what IS LangChain") == "the answer"
+
+
+def test_semantic_cache_miss_below_threshold(complete_chain: ModuleType) -> None:
+    """Questions with little token overlap stay below the threshold."""
+    cache = complete_chain.SemanticCache(threshold=0.9)
+    cache.store("What is LangChain?", "the answer")
+
+    assert cache.lookup("tell me about python packaging") is None
+
+
+def test_semantic_cache_empty_lookup(complete_chain: ModuleType) -> None:
+    """An empty cache never reports a hit."""
+    cache = complete_chain.SemanticCache(threshold=0.9)
+
+    assert cache.lookup("anything at all") is None
+
+
+def test_cached_invoke_skips_chain_on_hit(complete_chain: ModuleType) -> None:
+    """cached_invoke only runs the chain on a miss."""
+    calls: list[str] = []
+
+    def _answer(question: str) -> str:
+        calls.append(question)
+        return f"answer to {question}"
+
+    chain = RunnableLambda(_answer)
+    cache = complete_chain.SemanticCache(threshold=0.9)
+
+    first = complete_chain.cached_invoke(chain, cache, "What is LangChain?")
+    second = complete_chain.cached_invoke(chain, cache, "what is langchain")
+
+    assert first == second == "answer to What is LangChain?"
+    assert calls == ["What is LangChain?"]
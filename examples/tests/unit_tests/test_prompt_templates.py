@@ -0,0 +1,54 @@
+"""Unit tests for FastPromptTemplate in 02_prompt_templates."""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+
+def test_format_multi_variable(prompt_templates: ModuleType) -> None:
+    """Multi-variable templates render through the format_map path."""
+    template = prompt_templates.FastPromptTemplate.from_template(
+        "Tell me a {adjective} joke about {topic}."
+    )
+
+    assert template.format(adjective="funny", topic="cats") == (
+        "Tell me a funny joke about cats."
+    )
+
+
+def test_format_escaped_braces(prompt_templates: ModuleType) -> None:
+    """Escaped braces must not trigger the concat specialization."""
+    template = prompt_templates.FastPromptTemplate.from_template(
+        "Show {{literal}} and {value}"
+    )
+
+    assert template.format(value="X") == "Show {literal} and X"
+    # The fallback render path is the bound format_map, not a closure.
+    assert template._render == template.template.format_map
+
+
+def test_format_escaped_braces_after_variable(prompt_templates: ModuleType) -> None:
+    """Escapes in the suffix also force the fallback path."""
+    template = prompt_templates.FastPromptTemplate.from_template("a{value}b}}c")
+
+    assert template.format(value="X") == "aXb}c"
+
+
+def test_format_single_variable_specialization(prompt_templates: ModuleType) -> None:
+    """Plain prefix{var}suffix templates specialize to concatenation."""
+    template = prompt_templates.FastPromptTemplate.from_template("before {value} after")
+
+    assert template.format(value="X") == "before X after"
+    assert template.format(value="Y") == "before Y after"
+    assert template._render != template.template.format_map
+
+
+def test_format_partial_variables(prompt_templates: ModuleType) -> None:
+    """Partial variables are merged before rendering."""
+    template = prompt_templates.FastPromptTemplate(
+        template="Q: {question} (at {time})",
+        input_variables=["question"],
+        partial_variables={"time": lambda: "NOW"},
+    )
+
+    assert template.format(question="hi") == "Q: hi (at NOW)"
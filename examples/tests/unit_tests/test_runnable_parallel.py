@@ -0,0 +1,64 @@
+"""Unit tests for parallel_invoke in 03_runnable_parallel."""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
+
+
+def test_parallel_invoke_runs_all_branches(runnable_parallel: ModuleType) -> None:
+    """Every branch result lands under its key, in branch order."""
+    branches = {
+        "double": RunnableLambda(lambda x: x * 2),
+        "square": RunnableLambda(lambda x: x**2),
+    }
+
+    result = runnable_parallel.parallel_invoke(branches, 5)
+
+    assert result == {"double": 10, "square": 25}
+    assert list(result) == ["double", "square"]
+
+
+def test_parallel_invoke_bare_passthrough_is_identity(
+    runnable_parallel: ModuleType,
+) -> None:
+    """A bare passthrough returns the input without a pool hop."""
+    branches = {
+        "original": RunnablePassthrough(),
+        "doubled": RunnableLambda(lambda x: x * 2),
+    }
+
+    result = runnable_parallel.parallel_invoke(branches, 7)
+
+    assert result == {"original": 7, "doubled": 14}
+    assert list(result) == ["original", "doubled"]
+
+
+def test_parallel_invoke_passthrough_side_effects_run(
+    runnable_parallel: ModuleType,
+) -> None:
+    """A passthrough with a function must still run it for side effects."""
+    calls: list[int] = []
+    branches = {
+        "audit": RunnablePassthrough(calls.append),
+        "incremented": RunnableLambda(lambda x: x + 1),
+    }
+
+    result = runnable_parallel.parallel_invoke(branches, 99)
+
+    assert result == {"audit": 99, "incremented": 100}
+    assert calls == [99]
+
+
+def test_parallel_invoke_passthrough_side_effects_run_complete_chain(
+    complete_chain: ModuleType,
+) -> None:
+    """The complete-chain helper preserves side effects the same way."""
+    calls: list[int] = []
+    branches = {"audit": RunnablePassthrough(calls.append)}
+
+    result = complete_chain.parallel_invoke(branches, 42)
+
+    assert result == {"audit": 42}
+    assert calls == [42]